@@ -0,0 +1,51 @@
+"""Covering index for ledger transaction listing
+
+Revision ID: 824184bf1173
+Revises: 420c3915d08b
+Create Date: 2026-10-16 09:12:41.204511
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '824184bf1173'
+down_revision: Union[str, None] = '420c3915d08b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Replace (owner_id, date) with (owner_id, date, id) plus description so the
+    # transactions list is an index-only scan on PostgreSQL, and the keyset
+    # cursor (date, id) < ... ORDER BY date DESC, id DESC is a single backward
+    # index seek. INCLUDE/CONCURRENTLY are PostgreSQL-only and ignored on SQLite.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_ledger_owner_date_id', 'ledger_transactions', ['owner_id', 'date', 'id'],
+            unique=False,
+            postgresql_include=['description'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_ledger_owner_date', table_name='ledger_transactions',
+            postgresql_concurrently=True,
+        )
+        if op.get_bind().dialect.name == 'postgresql':
+            op.execute('ANALYZE ledger_transactions')
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_ledger_owner_date', 'ledger_transactions', ['owner_id', 'date'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_ledger_owner_date_id', table_name='ledger_transactions',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,50 @@
+"""Store lower-cased mapping patterns and index rules by owner and priority
+
+Revision ID: c7e2d94b1f36
+Revises: 824184bf1173
+Create Date: 2026-10-16 14:22:09.573120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e2d94b1f36'
+down_revision: Union[str, None] = '824184bf1173'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Add nullable, backfill existing rules, then enforce NOT NULL
+    op.add_column('mapping_rules', sa.Column('match_pattern_lower', sa.String(), nullable=True))
+    # Lower-case in Python, as create_rule does: SQLite's lower() only folds ASCII
+    rules = sa.table(
+        'mapping_rules',
+        sa.column('id', sa.String()),
+        sa.column('match_pattern', sa.String()),
+        sa.column('match_pattern_lower', sa.String()),
+    )
+    bind = op.get_bind()
+    for rule_id, pattern in bind.execute(sa.select(rules.c.id, rules.c.match_pattern)).all():
+        bind.execute(
+            rules.update().where(rules.c.id == rule_id).values(match_pattern_lower=pattern.lower())
+        )
+    with op.batch_alter_table('mapping_rules') as batch_op:
+        batch_op.alter_column('match_pattern_lower', existing_type=sa.String(), nullable=False)
+
+    # Covering on PostgreSQL so loading an owner's rules is an index-only scan
+    op.create_index(
+        'ix_mapping_rules_owner_priority', 'mapping_rules', ['owner_id', 'priority'],
+        unique=False,
+        postgresql_include=['match_pattern_lower', 'target_category_id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_mapping_rules_owner_priority', table_name='mapping_rules')
+    with op.batch_alter_table('mapping_rules') as batch_op:
+        batch_op.drop_column('match_pattern_lower')
@@ -5,7 +5,7 @@ Built on double-entry accounting principles with modern architecture
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 import os
 import logging
@@ -27,6 +27,7 @@ app = FastAPI(
     title=settings.app_name,
     version="2.0.0",
     debug=settings.debug,
+    default_response_class=ORJSONResponse,
     description="Personal Finance Tracker V2 - Built on double-entry accounting with support for split transactions, auto-categorization, and CSV imports."
 )
 
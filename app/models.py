@@ -58,7 +58,8 @@ class LedgerTransaction(Base):
     entries = relationship("Entry", back_populates="transaction", cascade="all, delete-orphan")
 
     __table_args__ = (
-        Index('ix_ledger_owner_date', 'owner_id', 'date'),
+        # Keyset order for the transactions list; covering on PostgreSQL so it is an index-only scan
+        Index('ix_ledger_owner_date_id', 'owner_id', 'date', 'id', postgresql_include=['description']),
     )
 
 class Entry(Base):
@@ -105,8 +106,14 @@ class MappingRule(Base):
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     owner_id = Column(String, ForeignKey("parties.id"), nullable=False)
     match_pattern = Column(String, nullable=False) # Case-insensitive partial match on description
+    match_pattern_lower = Column(String, nullable=False) # match_pattern.lower(), stored so matching never re-lowers
     target_category_id = Column(String, ForeignKey("accounts.id"), nullable=False)
     priority = Column(Integer, default=0)
     
     owner = relationship("Party")
-    target_category = relationship("Account") 
\ No newline at end of file
+    target_category = relationship("Account")
+
+    __table_args__ = (
+        # Covering on PostgreSQL so loading an owner's rules is an index-only scan
+        Index('ix_mapping_rules_owner_priority', 'owner_id', 'priority', postgresql_include=['match_pattern_lower', 'target_category_id']),
+    ) 
\ No newline at end of file
@@ -56,5 +56,7 @@ def list_accounts(
         assets = service.get_accounts(current_user.party_id, "ASSET")
         liabilities = service.get_accounts(current_user.party_id, "LIABILITY")
         accounts = assets + liabilities
-        
-    return accounts
+
+    # Flatten to dicts once so response validation reads plain keys rather than
+    # going through ORM attribute access for every field
+    return [{"id": acc.id, "name": acc.name, "type": acc.type} for acc in accounts]
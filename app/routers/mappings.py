@@ -47,7 +47,16 @@ def get_rules(
     """Get all rules for the user"""
     if not current_user.party_id:
         return []
-    return service.get_rules(current_user.party_id)
+    return [
+        {
+            "id": rule.id,
+            "owner_id": rule.owner_id,
+            "match_pattern": rule.match_pattern,
+            "target_category_id": rule.target_category_id,
+            "priority": rule.priority,
+        }
+        for rule in service.get_rules(current_user.party_id)
+    ]
 
 @router.delete("/{rule_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_rule(
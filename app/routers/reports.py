@@ -1,12 +1,13 @@
 """
 Reports Router (V2)
 """
+from typing import List
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models import User
 from app.core import dependencies
-from app import auth
+from app import auth, schemas
 from app.services.report_service import ReportService
 
 router = APIRouter(
@@ -18,7 +19,7 @@ router = APIRouter(
 def get_report_service(db: Session = Depends(get_db)) -> ReportService:
     return ReportService(db)
 
-@router.get("/monthly-category")
+@router.get("/monthly-category", response_model=List[schemas.CategoryExpense])
 def get_monthly_category_report(
     year: int = Query(..., ge=2000, le=2100),
     month: int = Query(..., ge=1, le=12),
@@ -30,7 +31,7 @@ def get_monthly_category_report(
     """
     return service.get_expenses_by_category(current_user, year, month)
 
-@router.get("/monthly-summary")
+@router.get("/monthly-summary", response_model=schemas.MonthlySummary)
 def get_monthly_summary_report(
     year: int = Query(..., ge=2000, le=2100),
     month: int = Query(..., ge=1, le=12),
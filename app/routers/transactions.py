@@ -3,6 +3,8 @@ Refactored transactions router using the new layered architecture
 Maintains original API paths for backwards compatibility
 """
 from fastapi import APIRouter, Depends, status, Query, HTTPException
+from fastapi.responses import ORJSONResponse
+from datetime import datetime
 from typing import List, Optional
 from app import schemas, auth
 from app.models import User
@@ -36,10 +38,21 @@ def get_transactions(
     month: Optional[int] = Query(None, ge=1, le=12, description="Filter by month"),
     category_id: Optional[str] = Query(None, description="Filter by category"),
     household_id: Optional[str] = Query(None, description="Include household transactions"),
-    skip: int = Query(0, ge=0, description="Skip records for pagination"),
-    limit: int = Query(100, ge=1, le=1000, description="Limit records for pagination")
+    skip: int = Query(0, ge=0, deprecated=True, description="Ignored; page with before_date/before_id instead"),
+    limit: int = Query(100, ge=1, le=1000, description="Limit records for pagination"),
+    before_date: Optional[datetime] = Query(None, description="Keyset cursor: occurred_on of the last transaction seen"),
+    before_id: Optional[str] = Query(None, description="Keyset cursor: id of the last transaction seen")
 ):
     """Get transactions with optional filters"""
-    return transaction_service.get_user_transactions(
-        current_user, year=year, month=month, category_id=category_id
-    )
\ No newline at end of file
+    if (before_date is None) != (before_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="before_date and before_id must be given together"
+        )
+    cursor = (before_date, before_id) if before_date is not None else None
+    transactions = transaction_service.get_user_transactions(
+        current_user, cursor=cursor, limit=limit, year=year, month=month, category_id=category_id
+    )
+    # Items are already validated schemas; serialize them directly instead of
+    # letting FastAPI re-validate the list against response_model
+    return ORJSONResponse([t.model_dump(mode="json") for t in transactions])
\ No newline at end of file
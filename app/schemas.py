@@ -1,10 +1,29 @@
-from pydantic import BaseModel, field_validator, Field, ConfigDict
-from typing import List, Optional
+from pydantic import AfterValidator, BaseModel, BeforeValidator, field_validator, Field, ConfigDict, StringConstraints
+from typing import Annotated, List, Literal, Optional, Union
 from datetime import datetime
-import re
-import uuid
 from enum import Enum
 
+ACCOUNT_TYPES = ('ASSET', 'LIABILITY', 'INCOME', 'EXPENSE')
+
+_DESCRIPTION_PATTERN = r'^[a-zA-Z0-9\s\-_.,!?()&@#$%]+$'
+_UUID_PATTERN = r'^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$'
+
+# ID fields are checked by pydantic-core itself instead of a Python validator
+UUIDStr = Annotated[str, StringConstraints(pattern=_UUID_PATTERN)]
+
+
+def _validate_amount(v: float) -> float:
+    if v == 0:
+        raise ValueError('Amount cannot be zero')
+    return round(v, 2)
+
+
+# Money in request bodies; stored as Float on Entry.amount and returned as a JSON number
+Amount = Annotated[float, Field(ge=-1_000_000, le=1_000_000), AfterValidator(_validate_amount)]
+Description = Annotated[str, StringConstraints(
+    strip_whitespace=True, min_length=1, max_length=500, pattern=_DESCRIPTION_PATTERN
+)]
+
 # ============================================================================
 # Authentication Schemas
 # ============================================================================
@@ -20,11 +39,12 @@ class UserLogin(BaseModel):
 class Token(BaseModel):
     access_token: str
     token_type: str
+    model_config = ConfigDict(frozen=True)
 
 class User(BaseModel):
     id: str
     username: str
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(frozen=True, from_attributes=True)
 
 
 # ============================================================================
@@ -43,7 +63,7 @@ class Category(BaseModel):
     name: str
     user_id: Optional[str] = None
     household_id: Optional[str] = None
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(frozen=True, from_attributes=True)
 
 
 # ============================================================================
@@ -54,25 +74,37 @@ class AccountCreate(BaseModel):
     name: str
     type: str
 
-    @field_validator('type')
+    @field_validator('type', mode='after')
+    @classmethod
     def validate_type(cls, v):
-        allowed = ['ASSET', 'LIABILITY', 'INCOME', 'EXPENSE']
-        if v.upper() not in allowed:
-            raise ValueError(f"Type must be one of {allowed}")
-        return v.upper()
+        v = v.upper()
+        if v not in ACCOUNT_TYPES:
+            raise ValueError(f"Type must be one of {list(ACCOUNT_TYPES)}")
+        return v
 
 class AccountResponse(BaseModel):
     id: str
     name: str
     type: str
     balance: Optional[float] = 0.0
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(frozen=True, from_attributes=True)
 
 
 # ============================================================================
 # Transaction Schemas (Double-Entry)
 # ============================================================================
 
+class TransactionType(str, Enum):
+    CREDIT = "CREDIT"
+    DEBIT = "DEBIT"
+    TRANSFER = "TRANSFER"
+
+def _upper(v):
+    return v.upper() if isinstance(v, str) else v
+
+# Case insensitive on input ("debit" -> DEBIT), matched as an enum after that
+TransactionTypeIn = Annotated[TransactionType, BeforeValidator(_upper)]
+
 class ShareMethod(str, Enum):
     FIXED = "FIXED"
     PERCENTAGE = "PERCENTAGE"
@@ -82,112 +114,48 @@ class ShareConfig(BaseModel):
     method: ShareMethod
     value: float  # amount, percent (0-100), or count (for EQUAL)
 
+class FixedShare(ShareConfig):
+    method: Literal[ShareMethod.FIXED]
+    value: Annotated[float, Field(gt=0)]
+
+class PercentageShare(ShareConfig):
+    method: Literal[ShareMethod.PERCENTAGE]
+    value: Annotated[float, Field(ge=0, le=100)]
+
+class EqualShare(ShareConfig):
+    method: Literal[ShareMethod.EQUAL]
+    value: Annotated[int, Field(ge=1)]
+
+# Tagged on method so only the matching variant is validated
+Share = Annotated[Union[FixedShare, PercentageShare, EqualShare], Field(discriminator='method')]
+
 class SplitRequest(BaseModel):
     category_id: str
-    amount: float
+    amount: Amount
     description: str
 
 class TransactionCreate(BaseModel):
-    category_id: str
-    type: str
-    description: str
-    amount: float
+    category_id: UUIDStr
+    type: TransactionTypeIn
+    description: Description
+    amount: Amount
     occurred_on: datetime
-    source_account_id: Optional[str] = None
+    source_account_id: Optional[UUIDStr] = None
     destination_account_id: Optional[str] = None
     splits: Optional[List['SplitRequest']] = None
-    share: Optional[ShareConfig] = None
-
-    @field_validator('category_id')
-    def validate_category_id(cls, v):
-        try:
-            uuid.UUID(v)
-        except ValueError:
-            raise ValueError('Invalid category ID format')
-        return v
-
-    @field_validator('source_account_id')
-    def validate_source_account_id(cls, v):
-        if v is not None:
-            try:
-                uuid.UUID(v)
-            except ValueError:
-                raise ValueError('Invalid source account ID format')
-        return v
-
-    @field_validator('type')
-    def validate_type(cls, v):
-        allowed_types = ['CREDIT', 'DEBIT', 'TRANSFER']
-        if v.upper() not in allowed_types:
-            raise ValueError(f'Type must be one of: {allowed_types}')
-        return v.upper()
-
-    @field_validator('description')
-    def validate_description(cls, v):
-        if not v or not v.strip():
-            raise ValueError('Description cannot be empty')
-        if len(v) > 500:
-            raise ValueError('Description too long (max 500 characters)')
-        if not re.match(r'^[a-zA-Z0-9\s\-_.,!?()&@#$%]+', v):
-            raise ValueError('Description contains invalid characters')
-        return v.strip()
-
-    @field_validator('amount')
-    def validate_amount(cls, v):
-        if v == 0:
-            raise ValueError('Amount cannot be zero')
-        if v < -1000000 or v > 1000000:
-            raise ValueError('Amount out of reasonable range (-1M to 1M)')
-        return round(v, 2)
+    share: Optional[Share] = None
 
 class TransactionUpdate(BaseModel):
+    # Not bound to any route yet; build the validator on first use, not at import
+    model_config = ConfigDict(defer_build=True)
+
     id: str
-    category_id: Optional[str] = None
-    type: Optional[str] = None
-    description: Optional[str] = None
-    amount: Optional[float] = None
+    category_id: Optional[UUIDStr] = None
+    type: Optional[Annotated[Literal[TransactionType.CREDIT, TransactionType.DEBIT], BeforeValidator(_upper)]] = None
+    description: Optional[Description] = None
+    amount: Optional[Amount] = None
     occurred_on: Optional[datetime] = None
 
-    @field_validator('category_id')
-    def validate_category_id(cls, v):
-        if v is not None:
-            try:
-                uuid.UUID(v)
-            except ValueError:
-                raise ValueError('Invalid category ID format')
-        return v
-
-    @field_validator('type')
-    def validate_type(cls, v):
-        if v is not None:
-            allowed_types = ['CREDIT', 'DEBIT']
-            if v.upper() not in allowed_types:
-                raise ValueError(f'Type must be one of: {allowed_types}')
-            return v.upper()
-        return v
-
-    @field_validator('description')
-    def validate_description(cls, v):
-        if v is not None:
-            if not v or not v.strip():
-                raise ValueError('Description cannot be empty')
-            if len(v) > 500:
-                raise ValueError('Description too long (max 500 characters)')
-            if not re.match(r'^[a-zA-Z0-9\\s\\-_.,!?()&@#$%]+', v):
-                raise ValueError('Description contains invalid characters')
-            return v.strip()
-        return v
-
-    @field_validator('amount')
-    def validate_amount(cls, v):
-        if v is not None:
-            if v == 0:
-                raise ValueError('Amount cannot be zero')
-            if v < -1000000 or v > 1000000:
-                raise ValueError('Amount out of reasonable range (-1M to 1M)')
-            return round(v, 2)
-        return v
-
 class Transaction(BaseModel):
     id: str
     user_id: str
@@ -198,7 +166,7 @@ class Transaction(BaseModel):
     occurred_on: datetime
     created_at: Optional[datetime] = None
     category: Optional[Category] = None
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(frozen=True, from_attributes=True)
 
 
 # ============================================================================
@@ -216,14 +184,27 @@ class MappingRuleResponse(BaseModel):
     match_pattern: str
     target_category_id: str
     priority: int
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(frozen=True, from_attributes=True)
 
 
 # ============================================================================
 # Report Schemas
 # ============================================================================
 
+class CategoryExpense(BaseModel):
+    category: str
+    amount: float
+    model_config = ConfigDict(frozen=True)
+
+class MonthlySummary(BaseModel):
+    income: float
+    expenses: float
+    net: float
+    model_config = ConfigDict(frozen=True)
+
 class TransactionFilter(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     year: Optional[int] = None
     month: Optional[int] = None
     category_id: Optional[str] = None
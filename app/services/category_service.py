@@ -2,6 +2,7 @@
 Category Service Generic Adapter (V2)
 """
 from typing import List, Optional, Dict, Any
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from app.services.ledger_service import LedgerService
 from app.core.exceptions import raise_http_exception
@@ -74,14 +75,20 @@ class CategoryService:
     # The Router calls these methods, so we must define them, even if they No-Op or Error.
     
     def seed_custom_categories(self, names: List[str], user: User) -> List[CategorySchema]:
-        created = []
-        for name in names:
-            acc = self.ledger.create_account(
-                owner_id=user.party_id, 
-                name=name, 
-                type="EXPENSE"
+        # One IN query for names that already exist instead of a lookup per name
+        existing = set(self.db.scalars(
+            select(Account.name).where(
+                Account.owner_id == user.party_id,
+                Account.type == "EXPENSE",
+                Account.is_active == True,
+                Account.name.in_(names),
             )
-            created.append(self._to_schema(acc, user.id))
+        ))
+        new_names = [n for n in dict.fromkeys(names) if n not in existing]
+        accounts = self.ledger.create_accounts(user.party_id, [(name, "EXPENSE") for name in new_names])
+        # Map before committing so the schemas don't reload each expired row
+        created = [self._to_schema(acc, user.id) for acc in accounts]
+        self.db.commit()
         return created
 
     def update_category(self, id: str, data: CategoryUpdate, user: User):
@@ -101,10 +108,10 @@ class CategoryService:
             self.db.commit()
 
     def search_categories(self, q: str, user: User, household_id: str=None, limit: int=50):
-         # Needs a search method in Ledger
-         # For MVP, fetch all and filter in python (inefficient but safe)
-         all_cats = self.get_user_categories(user)
-         return [c for c in all_cats if q.lower() in c.name.lower()][:limit]
+         if not user.party_id:
+             return []
+         accounts = self.ledger.search_accounts(user.party_id, q, "EXPENSE", limit)
+         return [self._to_schema(acc, user.id) for acc in accounts]
     
     def get_category_statistics(self, *args, **kwargs):
         # Stub
@@ -1,15 +1,32 @@
 from datetime import datetime
 import logging
+import threading
+import time
 
 from app.config import settings
 from app.database import check_database_connection, get_database_info
 
 logger = logging.getLogger(__name__)
 
+# Probes hit these endpoints often; reuse the last DB check for a short window
+TTL = 2.0
+_cache = {"t": 0.0, "status": None, "info": None}
+_cache_lock = threading.Lock()
+
+
+def _cached_database_state():
+    """Return (db_status, db_info), refreshing at most once per TTL"""
+    with _cache_lock:
+        if _cache["status"] is None or time.monotonic() - _cache["t"] >= TTL:
+            _cache["status"] = check_database_connection()
+            _cache["info"] = get_database_info()
+            _cache["t"] = time.monotonic()
+        return _cache["status"], _cache["info"]
+
+
 class HealthService:
     def health_check(self):
-        db_status = check_database_connection()
-        db_info = get_database_info()
+        db_status, db_info = _cached_database_state()
         
         return {
             "status": "healthy" if db_status else "unhealthy",
@@ -24,8 +41,7 @@ class HealthService:
         }
 
     def get_database_info(self):
-        db_info = get_database_info()
-        db_status = check_database_connection()
+        db_status, db_info = _cached_database_state()
         
         return {
             "profile": db_info["profile"],
@@ -15,6 +15,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Fallback formats tried in order when the date isn't ISO-8601
+_DATE_FORMATS = ("%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%Y/%m/%d")
+
 class ImportService:
     def __init__(self, db: Session):
         self.db = db
@@ -38,7 +41,15 @@ class ImportService:
         try:
             # Decode file
             content = file_content.decode('utf-8')
-            csv_reader = csv.DictReader(io.StringIO(content))
+            csv_reader = csv.reader(io.StringIO(content))
+
+            # Read and clean the header once, then index rows by position
+            header = [h.strip().lower() for h in next(csv_reader, [])]
+            col = {name: header.index(name) for name in ("date", "description", "amount", "category") if name in header}
+
+            def cell(row: List[str], name: str, default: str = "") -> str:
+                i = col.get(name)
+                return row[i].strip() if i is not None else default
             
             # Helper: Get all expense accounts for lookup (Name -> ID)
             accounts = self.ledger.get_accounts(user.party_id, "EXPENSE")
@@ -51,34 +62,33 @@ class ImportService:
                 acc = self.ledger.create_account(user.party_id, "Uncategorized", "EXPENSE")
                 uncategorized_id = acc.id
             
-            # Load Auto-Rules
-            rules = self.mapping.get_rules(user.party_id)
+            # Load Auto-Rules once for the whole file
+            match_rule = self.mapping.build_matcher(user.party_id)
             
             # Get default source (Cash)
             source_acc = self.ledger.get_or_create_default_asset_account(user.party_id)
             
-            count = 0
+            pending = []
             skipped = 0
             
             for row in csv_reader:
+                if not row:
+                    continue # Blank line
                 try:
-                    # Clean keys (trim whitespace)
-                    row = {k.strip(): v.strip() for k, v in row.items() if k}
-                    
                     # 1. Parse Date
                     # Try a few formats
-                    date_str = row.get("Date", "")
+                    date_str = cell(row, "date")
                     occurred_on = self._parse_date(date_str)
                     
                     # 2. Parse Amount
-                    amount_str = row.get("Amount", "0")
+                    amount_str = cell(row, "amount", "0")
                     amount = float(amount_str.replace("$", "").replace(",", ""))
                     
                     # 3. Parse Description
-                    description = row.get("Description", "Imported Transaction")
+                    description = cell(row, "description", "Imported Transaction")
                     
                     # 4. Determine Category/Account
-                    cat_name = row.get("Category", "").lower()
+                    cat_name = cell(row, "category").lower()
                     target_category_id = None
                     
                     # A. Explicit in CSV
@@ -87,7 +97,7 @@ class ImportService:
                     
                     # B. Auto-Rules (if not explicitly matched yet)
                     if not target_category_id:
-                        target_category_id = self.mapping.apply_rules(user.party_id, description)
+                        target_category_id = match_rule(description)
                         
                     # C. Uncategorized (Fallback)
                     if not target_category_id:
@@ -102,27 +112,29 @@ class ImportService:
                         {"account_id": target_category_id, "amount": amount}
                     ]
                     
-                    self.ledger.record_transaction(
-                        owner_id=user.party_id,
-                        description=description,
-                        date=occurred_on,
-                        entries_data=entries
-                    )
-                    count += 1
+                    pending.append((description, occurred_on, entries))
                     
                 except Exception as e:
                     logger.warning(f"Skipping row {row}: {e}")
                     skipped += 1
             
-            return {"imported": count, "skipped": skipped}
+            # Write every parsed row in one batch and a single commit
+            if pending:
+                self.ledger.record_transactions_bulk(user.party_id, pending)
+
+            return {"imported": len(pending), "skipped": skipped}
             
         except Exception as e:
             logger.error(f"CSV Parse Error: {e}")
             raise_http_exception(400, "Failed to parse CSV file.")
 
     def _parse_date(self, date_str: str) -> datetime:
-        formats = ["%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", "%Y/%m/%d"]
-        for fmt in formats:
+        # Most exports are ISO-8601; fromisoformat is much cheaper than strptime
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
+        for fmt in _DATE_FORMATS:
             try:
                 return datetime.strptime(date_str, fmt)
             except ValueError:
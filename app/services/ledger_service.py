@@ -2,13 +2,25 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func
 import uuid
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 
 from app.models import Party, Account, LedgerTransaction, Entry
 import logging
 
 logger = logging.getLogger("finance_tracker.ledger")
 
+# (name, type) seeded for every new party: root accounts, then common accounts
+DEFAULT_ACCOUNTS = (
+    ("Assets", "ASSET"),
+    ("Liabilities", "LIABILITY"),
+    ("Income", "INCOME"),
+    ("Expenses", "EXPENSE"),
+    # ("Checking", "ASSET"), # Real implementation would link to Assets parent
+    ("Cash", "ASSET"),
+    ("Groceries", "EXPENSE"),
+    ("Salary", "INCOME"),
+)
+
 class LedgerService:
     def __init__(self, db: Session):
         self.db = db
@@ -32,6 +44,13 @@ class LedgerService:
         self.db.refresh(account)
         return account
 
+    def create_accounts(self, owner_id: str, specs: Sequence[Tuple[str, str]]) -> List[Account]:
+        """Add (name, type) accounts in one batch; the caller commits"""
+        accounts = [Account(owner_id=owner_id, name=name, type=type) for name, type in specs]
+        self.db.add_all(accounts)
+        self.db.flush()
+        return accounts
+
     def record_transaction(self, owner_id: str, description: str, date, entries_data: list) -> LedgerTransaction:
         """Record a balanced double-entry transaction"""
         logger.debug(f"Recording transaction for owner {owner_id}: {description}")
@@ -40,38 +59,48 @@ class LedgerService:
         if abs(total) > 0.0001:
              raise ValueError(f"Transaction not balanced: {total}")
         
+        # Entries are attached through the relationship so a single flush on
+        # commit inserts the transaction first and fills in transaction_id
         transaction = LedgerTransaction(
             owner_id=owner_id,
             description=description,
-            date=date
+            date=date,
+            entries=[
+                Entry(account_id=e_data['account_id'], amount=e_data['amount'])
+                for e_data in entries_data
+            ]
         )
         self.db.add(transaction)
-        self.db.flush() # Get ID
-        
-        for e_data in entries_data:
-            entry = Entry(
-                transaction_id=transaction.id,
-                account_id=e_data['account_id'],
-                amount=e_data['amount']
-            )
-            self.db.add(entry)
-            
         self.db.commit()
         self.db.refresh(transaction)
         return transaction
     
+    def record_transactions_bulk(self, owner_id: str, rows: List[Tuple[str, datetime, list]]) -> List[LedgerTransaction]:
+        """Record many balanced (description, date, entries_data) transactions with one commit"""
+        totals = [sum(e['amount'] for e in entries_data) for _, _, entries_data in rows]
+        unbalanced = next((t for t in totals if abs(t) > 0.0001), None)
+        if unbalanced is not None:
+             raise ValueError(f"Transaction not balanced: {unbalanced}")
+
+        transactions = [
+            LedgerTransaction(
+                owner_id=owner_id,
+                description=description,
+                date=date,
+                entries=[
+                    Entry(account_id=e_data['account_id'], amount=e_data['amount'])
+                    for e_data in entries_data
+                ]
+            )
+            for description, date, entries_data in rows
+        ]
+        self.db.add_all(transactions)
+        self.db.commit()
+        return transactions
+
     def seed_default_accounts(self, party_id: str):
-        # Create Root Accounts
-        self.create_account(party_id, "Assets", "ASSET")
-        self.create_account(party_id, "Liabilities", "LIABILITY")
-        self.create_account(party_id, "Income", "INCOME")
-        self.create_account(party_id, "Expenses", "EXPENSE")
-        
-        # Create Common Accounts
-        # checking = self.create_account(party_id, "Checking", "ASSET") # Real implementation would link to Assets parent
-        self.create_account(party_id, "Cash", "ASSET")
-        self.create_account(party_id, "Groceries", "EXPENSE")
-        self.create_account(party_id, "Salary", "INCOME")
+        self.create_accounts(party_id, DEFAULT_ACCOUNTS)
+        self.db.commit()
 
     def get_accounts(self, owner_id: str, type: str = None) -> List[Account]:
         query = self.db.query(Account).filter(Account.owner_id == owner_id, Account.is_active == True)
@@ -79,6 +108,17 @@ class LedgerService:
             query = query.filter(Account.type == type)
         return query.all()
 
+    def search_accounts(self, owner_id: str, q: str, type: str = None, limit: int = 50) -> List[Account]:
+        """Case-insensitive substring search on account name, filtered in SQL"""
+        query = self.db.query(Account).filter(
+            Account.owner_id == owner_id,
+            Account.is_active == True,
+            func.lower(Account.name).contains(q.lower(), autoescape=True)
+        )
+        if type:
+            query = query.filter(Account.type == type)
+        return query.limit(limit).all()
+
     def get_account_by_name(self, owner_id: str, name: str) -> Optional[Account]:
         return self.db.query(Account).filter(
             Account.owner_id == owner_id, 
@@ -87,7 +127,9 @@ class LedgerService:
         ).first()
 
     def get_account(self, account_id: str) -> Optional[Account]:
-        return self.db.query(Account).filter(Account.id == account_id).first()
+        # Session.get checks the identity map first, so repeated lookups of the
+        # same account within a request don't go back to the database
+        return self.db.get(Account, account_id)
         
     def get_or_create_default_asset_account(self, owner_id: str) -> Account:
         """Helper for MVP: get a default 'Cash' or 'Source' account"""
@@ -2,9 +2,9 @@
 Mapping Service (V2)
 Handles Auto-Categorization Rules
 """
-from typing import List, Optional
+from typing import Callable, List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import String, desc, func, literal, select
 from app.models import MappingRule
 import logging
 
@@ -19,6 +19,7 @@ class MappingService:
         rule = MappingRule(
             owner_id=owner_id,
             match_pattern=match_pattern,
+            match_pattern_lower=match_pattern.lower(),
             target_category_id=target_category_id,
             priority=priority
         )
@@ -28,9 +29,11 @@ class MappingService:
         return rule
 
     def get_rules(self, owner_id: str) -> List[MappingRule]:
+        if not owner_id:
+            return []
         return self.db.query(MappingRule).filter(
             MappingRule.owner_id == owner_id
-        ).order_by(desc(MappingRule.priority)).all()
+        ).order_by(desc(MappingRule.priority), MappingRule.id).all()
 
     def delete_rule(self, rule_id: str, owner_id: str):
         rule = self.db.query(MappingRule).filter(
@@ -41,15 +44,44 @@ class MappingService:
             self.db.delete(rule)
             self.db.commit()
 
+    def build_matcher(self, owner_id: str) -> Callable[[str], Optional[str]]:
+        """
+        Load the owner's lower-cased rules once, returning a function that
+        maps a description to a target_category_id (or None) in priority order.
+        """
+        patterns = [
+            (rule.match_pattern_lower, rule.target_category_id)
+            for rule in self.get_rules(owner_id)
+        ]
+
+        def match(description: str) -> Optional[str]:
+            text = description.lower()
+            return next((target for pattern, target in patterns if pattern in text), None)
+
+        return match
+
     def apply_rules(self, owner_id: str, description: str) -> Optional[str]:
         """
         Returns the target_category_id if a match is found, else None.
+        Matching runs in the database so only the winning rule comes back;
+        use build_matcher when classifying many descriptions.
         """
-        rules = self.get_rules(owner_id)
-        
-        # Apply rules in priority order (desc)
-        for rule in rules:
-            # Case-insensitive partial match
-            if rule.match_pattern.lower() in description.lower():
-                return rule.target_category_id
-        return None
+        if not owner_id or not description:
+            return None
+
+        # Case-insensitive partial match, with LIKE wildcards in the pattern
+        # escaped so they match literally
+        pattern = MappingRule.match_pattern_lower
+        for char in ("/", "%", "_"):
+            pattern = func.replace(pattern, char, "/" + char, type_=String)
+
+        # id breaks priority ties so equal-priority rules always resolve the same way
+        return self.db.execute(
+            select(MappingRule.target_category_id)
+            .where(
+                MappingRule.owner_id == owner_id,
+                literal(description.lower()).like(literal("%") + pattern + literal("%"), escape="/")
+            )
+            .order_by(desc(MappingRule.priority), MappingRule.id)
+            .limit(1)
+        ).scalar()
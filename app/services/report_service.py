@@ -2,46 +2,71 @@
 Report Service (V2)
 Aggregates Ledger Entries for Financial Reporting
 """
-from typing import List, Dict, Any
+from datetime import datetime
+from typing import List, Dict, Any, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import case, func, select
 from app.models import Entry, Account, LedgerTransaction, User
 
+def _month_bounds(year: int, month: int) -> Tuple[datetime, datetime]:
+    """Half-open [start, end) range for a month, usable by the (owner_id, date) index"""
+    start = datetime(year, month, 1)
+    end = datetime(year + (month == 12), month % 12 + 1, 1)
+    return start, end
+
 class ReportService:
     def __init__(self, db: Session):
         self.db = db
 
-    def get_expenses_by_category(self, user: User, year: int, month: int) -> List[Dict[str, Any]]:
+    def _aggregate_month(self, user: User, year: int, month: int) -> List[Tuple[str, str, float, float]]:
         """
-        Sum positive entries in EXPENSE accounts for a given month.
+        One pass over the month's entries on EXPENSE/INCOME accounts.
+        Returns (type, name, debits, credits) per account name, where debits
+        sums positive entries and credits sums the magnitude of negative ones.
         """
-        if not user.party_id:
-             return []
-
         # Logic:
         # 1. Join Entries -> LedgerTransaction to filter by Date
-        # 2. Join Entries -> Account to filter by Type=EXPENSE and Owner=Party
-        # 3. Group by Account
-        
-        results = (
-            self.db.query(
+        # 2. Join Entries -> Account to filter by Type and Owner=Party
+        # 3. Group by Account type and name, splitting debits from credits
+        start, end = _month_bounds(year, month)
+
+        stmt = (
+            select(
+                Account.type,
                 Account.name,
-                func.sum(Entry.amount).label("total")
+                func.sum(case((Entry.amount > 0, Entry.amount), else_=0.0)).label("debits"),
+                func.sum(case((Entry.amount < 0, -Entry.amount), else_=0.0)).label("credits")
             )
             .join(LedgerTransaction, Entry.transaction_id == LedgerTransaction.id)
             .join(Account, Entry.account_id == Account.id)
-            .filter(
+            .where(
                 Account.owner_id == user.party_id,
-                Account.type == "EXPENSE",
-                func.extract('year', LedgerTransaction.date) == year,
-                func.extract('month', LedgerTransaction.date) == month,
-                Entry.amount > 0 # Expenses are Debits (positive)
+                Account.type.in_(("EXPENSE", "INCOME")),
+                LedgerTransaction.date >= start,
+                LedgerTransaction.date < end,
             )
-            .group_by(Account.name)
-            .all()
+            .group_by(Account.type, Account.name)
         )
-        
-        return [{"category": name, "amount": float(total)} for name, total in results]
+
+        # Core rows: no ORM entity processing, at most one row per account
+        return [
+            (type, name, float(debits), float(credits))
+            for type, name, debits, credits in self.db.execute(stmt)
+        ]
+
+    def get_expenses_by_category(self, user: User, year: int, month: int) -> List[Dict[str, Any]]:
+        """
+        Sum positive entries in EXPENSE accounts for a given month.
+        """
+        if not user.party_id:
+             return []
+
+        # Expenses are Debits (positive)
+        return [
+            {"category": name, "amount": debits}
+            for type, name, debits, _ in self._aggregate_month(user, year, month)
+            if type == "EXPENSE" and debits > 0
+        ]
 
     def get_monthly_summary(self, user: User, year: int, month: int) -> Dict[str, float]:
         """
@@ -49,42 +74,17 @@ class ReportService:
         """
         if not user.party_id:
             return {"income": 0.0, "expenses": 0.0, "net": 0.0}
-            
+
+        rows = self._aggregate_month(user, year, month)
+
         # Expenses: Sum of Debits to EXPENSE accounts
-        expenses = (
-            self.db.query(func.sum(Entry.amount))
-            .join(LedgerTransaction, Entry.transaction_id == LedgerTransaction.id)
-            .join(Account, Entry.account_id == Account.id)
-            .filter(
-                Account.owner_id == user.party_id,
-                Account.type == "EXPENSE",
-                func.extract('year', LedgerTransaction.date) == year,
-                func.extract('month', LedgerTransaction.date) == month,
-                Entry.amount > 0
-            )
-            .scalar()
-        ) or 0.0
-        
-        # Income: Sum of Credits to INCOME accounts (negative numbers usually)
-        # But wait, Credits are negative in our system.
-        # Income increases with Credit.
-        # So we want sum(abs(amount)) for CREDIT entries to INCOME accounts
-        income_neg = (
-            self.db.query(func.sum(Entry.amount))
-            .join(LedgerTransaction, Entry.transaction_id == LedgerTransaction.id)
-            .join(Account, Entry.account_id == Account.id)
-            .filter(
-                Account.owner_id == user.party_id,
-                Account.type == "INCOME",
-                func.extract('year', LedgerTransaction.date) == year,
-                func.extract('month', LedgerTransaction.date) == month,
-                Entry.amount < 0
-            )
-            .scalar()
-        ) or 0.0
-        
-        income = abs(income_neg)
-        
+        expenses = sum((debits for type, _, debits, _ in rows if type == "EXPENSE"), 0.0)
+
+        # Income: Sum of Credits to INCOME accounts
+        # Credits are negative in our system and income increases with Credit,
+        # so _aggregate_month already reports them as a positive magnitude
+        income = sum((credits for type, _, _, credits in rows if type == "INCOME"), 0.0)
+
         return {
             "income": income,
             "expenses": expenses,
@@ -1,9 +1,10 @@
 """
 Transaction Service Generic Adapter (V2)
 """
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from datetime import datetime
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy import and_, case, desc, func, inspect, select, tuple_
 from app.services.ledger_service import LedgerService
 from app.core.error_handler import raise_http_exception
 import logging
@@ -68,25 +69,37 @@ class TransactionService:
             data.category_id = data.destination_account_id
             
         elif data.splits:
-            # Split Logic: Create separate transactions for each split
+            # Split Logic: Create separate transactions for each split,
+            # written together with a single commit
             logger.info(f"Processing split transaction with {len(data.splits)} splits")
-            results = []
-            for split in data.splits:
-                split_amount = abs(split.amount)
-                entries = [
-                    {"account_id": source_account.id, "amount": -split_amount},
-                    {"account_id": split.category_id, "amount": split_amount}
-                ]
-                
-                txn = self.ledger.record_transaction(
-                    owner_id=user.party_id,
+            rows = [
+                (
+                    split.description,
+                    data.occurred_on,
+                    [
+                        {"account_id": source_account.id, "amount": -abs(split.amount)},
+                        {"account_id": split.category_id, "amount": abs(split.amount)}
+                    ]
+                )
+                for split in data.splits
+            ]
+            txns = self.ledger.record_transactions_bulk(user.party_id, rows)
+
+            # Commit expired the new rows, but every response field is already
+            # known here; the identity key gives the id without a refresh
+            return [
+                TransactionSchema(
+                    id=inspect(txn).identity[0],
+                    user_id=user.id,
+                    category_id=split.category_id,
+                    type="EXPENSE",
                     description=split.description,
-                    date=data.occurred_on,
-                    entries_data=entries
+                    amount=abs(split.amount),
+                    occurred_on=data.occurred_on,
+                    created_at=data.occurred_on
                 )
-                results.append(self._to_schema(txn, user.id, split.category_id, split_amount))
-            
-            return results
+                for txn, split in zip(txns, data.splits)
+            ]
 
         elif data.share:
              # Share Logic (Reimbursable)
@@ -102,8 +115,7 @@ class TransactionService:
              elif method == "PERCENTAGE":
                  personal_amt = amount * (val / 100.0)
              elif method == "EQUAL":
-                 # Value is count of people (e.g. 2 for 50/50)
-                 if val <= 0: val = 1
+                 # Value is count of people (e.g. 2 for 50/50), validated >= 1
                  personal_amt = amount / val
 
              # Validation
@@ -122,11 +134,15 @@ class TransactionService:
              )
              
              # Entries: Credit Source, Debit Category (Personal), Debit Reimbursable
-             entries.append({"account_id": source_account.id, "amount": -amount})
-             if personal_amt > 0:
-                 entries.append({"account_id": data.category_id, "amount": personal_amt})
-             if reimbursable_amt > 0:
-                 entries.append({"account_id": reimbursable_account.id, "amount": reimbursable_amt})
+             # Built in one expression; debits that round to nothing are left out
+             entries = [{"account_id": source_account.id, "amount": -amount}] + [
+                 {"account_id": account_id, "amount": amt}
+                 for account_id, amt in (
+                     (data.category_id, personal_amt),
+                     (reimbursable_account.id, reimbursable_amt),
+                 )
+                 if amt > 0
+             ]
 
         else:
             # Standard Expense
@@ -145,33 +161,56 @@ class TransactionService:
         
         return [self._to_schema(txn, user.id, data.category_id, amount)]
 
-    def get_user_transactions(self, user: User, **kwargs) -> List[TransactionSchema]:
-        # Fetch Ledger Transactions
-        # Optimally we should filter by owner_id
-        txns = self.db.query(LedgerTransaction).filter(
-            LedgerTransaction.owner_id == user.party_id
-        ).order_by(desc(LedgerTransaction.date)).limit(100).all()
-        
-        results = []
-        for txn in txns:
-            # Rehydrate Schema
-            # For splits, we need to sum all positive (debit) entries
-            # For simple transactions, there's only one
-            positive_entries = [e for e in txn.entries if e.amount > 0]
-            
-            if positive_entries:
-                # Sum all positive amounts (handles splits correctly)
-                amount = sum(e.amount for e in positive_entries)
-                # Use first positive entry's account as primary category
-                cat_id = positive_entries[0].account_id
-            else:
-                # Fallback for weird transactions (e.g. Transfers)
-                cat_id = "unknown"
-                amount = 0.0
-            
-            results.append(self._to_schema(txn, user.id, cat_id, amount))
-            
-        return results
+    def get_user_transactions(self, user: User, cursor: Optional[Tuple[datetime, str]] = None, limit: int = 100, **kwargs) -> List[TransactionSchema]:
+        if not user.party_id:
+            return []
+
+        # Page of the latest ledger transactions for this party. Keyset
+        # pagination: pass the (date, id) of the last row seen as the cursor
+        # to seek straight to the next page on the (owner_id, date, id) index
+        page = select(LedgerTransaction.id).where(LedgerTransaction.owner_id == user.party_id)
+        if cursor:
+            page = page.where(tuple_(LedgerTransaction.date, LedgerTransaction.id) < tuple_(*cursor))
+        page = (
+            page
+            .order_by(desc(LedgerTransaction.date), desc(LedgerTransaction.id))
+            .limit(limit)
+            .cte("page")
+        )
+
+        # Rehydrate amount and category in SQL, for that page only:
+        # amount is the sum of positive (debit) entries, which handles splits;
+        # the category is the debited EXPENSE account, else any debited account
+        # (e.g. the destination of a transfer)
+        is_debit = Entry.amount > 0
+        agg = (
+            select(
+                Entry.transaction_id,
+                func.sum(case((is_debit, Entry.amount), else_=0.0)).label("amount"),
+                func.coalesce(
+                    func.min(case((and_(is_debit, Account.type == "EXPENSE"), Entry.account_id))),
+                    func.min(case((is_debit, Entry.account_id)))
+                ).label("category_id")
+            )
+            .join(Account, Entry.account_id == Account.id)
+            .where(Entry.transaction_id.in_(select(page.c.id)))
+            .group_by(Entry.transaction_id)
+            .subquery()
+        )
+
+        stmt = (
+            select(LedgerTransaction, agg.c.amount, agg.c.category_id)
+            .options(raiseload('*'))
+            .join(page, page.c.id == LedgerTransaction.id)
+            .outerjoin(agg, agg.c.transaction_id == LedgerTransaction.id)
+            .order_by(desc(LedgerTransaction.date), desc(LedgerTransaction.id))
+        )
+
+        # Fallback for weird transactions (e.g. no debit entries)
+        return [
+            self._to_schema(txn, user.id, cat_id or "unknown", amount or 0.0)
+            for txn, amount, cat_id in self.db.execute(stmt)
+        ]
 
     def _to_schema(self, txn: LedgerTransaction, user_id: str, category_id: str, amount: float) -> TransactionSchema:
         # Determine type based on entries if possible
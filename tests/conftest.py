@@ -1,57 +1,120 @@
+import importlib
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event, lambda_stmt, select
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.pool import StaticPool
 from app.database import Base, get_db
+from app.models import Entry, LedgerTransaction
 from fastapi.testclient import TestClient
+from app.auth import pwd_context
 from app.config import settings
 from fastapi import FastAPI
-
-# Import all routers
-from app.routers import (
-    auth, transactions, categories, health, imports, reports, accounts, mappings
-)
+from fastapi.responses import ORJSONResponse
 
 # Override settings for testing
 settings.testing = True
 settings.database_profile = "sqlite"
 
-# Create a test engine and session
-engine = create_engine(settings.database_url, connect_args={"check_same_thread": False})
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Minimum bcrypt cost: every test registers and logs in, and the default
+# work factor makes hashing the slowest part of the suite
+pwd_context.update(bcrypt__rounds=4)
+
+# One in-memory database for the whole run; the schema is built once and
+# each test's writes are rolled back instead of dropping every table
+engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+
+# pysqlite's own transaction handling breaks SAVEPOINT; let SQLAlchemy emit BEGIN
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+# Durability and journaling buy nothing for a throwaway in-memory database
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+@event.listens_for(engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+@pytest.fixture(scope="session")
+def _connection():
+    Base.metadata.create_all(bind=engine)
+    conn = engine.connect()
+    yield conn
+    conn.close()
 
 @pytest.fixture(name="db_session")
-def db_session_fixture():
-    Base.metadata.create_all(bind=engine)  # Create tables
-    db = TestingSessionLocal()
+def db_session_fixture(_connection):
+    # Service commits and rollbacks act on a SAVEPOINT inside the outer
+    # transaction, which is rolled back on teardown
+    trans = _connection.begin()
+    db = Session(bind=_connection, autoflush=False, join_transaction_mode="create_savepoint")
     try:
         yield db
     finally:
         db.close()
-        Base.metadata.drop_all(bind=engine)  # Drop tables after tests
+        trans.rollback()
 
-@pytest.fixture(name="client")
-def client_fixture(db_session: TestingSessionLocal):
-    # Create a new FastAPI app instance for each test
+@pytest.fixture
+def fetch_txn(db_session: Session):
+    """Load one transaction by description with its entries and their accounts eagerly"""
+    def fetch(description):
+        # lambda_stmt caches the built statement, so repeat calls only rebind the description
+        stmt = lambda_stmt(
+            lambda: select(LedgerTransaction)
+            .options(selectinload(LedgerTransaction.entries).selectinload(Entry.account))
+            .where(LedgerTransaction.description == description)
+        )
+        return db_session.scalars(stmt).one()
+    return fetch
+
+@pytest.fixture
+def index_entries():
+    """Map a transaction's entries by account_id in a single pass"""
+    def index(txn):
+        return {e.account_id: e for e in txn.entries}
+    return index
+
+@pytest.fixture(name="app", scope="session")
+def app_fixture():
+    # Build the app and register routers once for the whole run
     app = FastAPI(
         title=settings.app_name,
         version="2.0.0",
         debug=settings.debug,
+        default_response_class=ORJSONResponse,
         description="Personal and Household Finance Management API - Refactored with layered architecture for better maintainability and performance."
     )
 
+    # Routers are imported here rather than at module top so their import
+    # cost is only paid when a test actually asks for the app.
     # Include routers with /api prefix to maintain original API structure
-    app.include_router(auth.router, prefix="/api")
-    app.include_router(categories.router, prefix="/api")
-    app.include_router(transactions.router, prefix="/api")
-    app.include_router(accounts.router, prefix="/api")
-    app.include_router(imports.router, prefix="/api")
-    app.include_router(mappings.router, prefix="/api")
-    app.include_router(reports.router, prefix="/api")
-    app.include_router(health.router, prefix="/api")
+    for name in ("auth", "categories", "transactions", "accounts", "imports", "mappings", "reports", "health"):
+        app.include_router(importlib.import_module(f"app.routers.{name}").router, prefix="/api")
+    return app
+
+@pytest.fixture(scope="session")
+def _test_client(app: FastAPI):
+    # Enter the client once so startup/shutdown handlers run once per run;
+    # per-test isolation comes from the db_session SAVEPOINT, not a new client
+    with TestClient(app) as client:
+        yield client
 
+@pytest.fixture(name="client")
+def client_fixture(app: FastAPI, _test_client: TestClient, db_session: Session):
+    # Only the DB dependency changes per test
     def override_get_db():
         yield db_session
     app.dependency_overrides[get_db] = override_get_db
-    with TestClient(app) as client:
-        yield client
-    app.dependency_overrides.clear()
+    _test_client.cookies.clear()
+    yield _test_client
+    app.dependency_overrides.pop(get_db, None)
@@ -3,6 +3,14 @@ from fastapi.testclient import TestClient
 from app.models import LedgerTransaction
 import io
 
+_CSV = b"""Date,Description,Amount,Category
+2024-06-01,Whole Foods,150.00,Groceries
+2024-06-02,Uber Trip,-25.50,Transport
+2024-06-03,Unknown store,10.00,
+"""
+# Note: Uber Trip is negative, our parser takes absolute value.
+# Empty category should map to "Uncategorized"
+
 def test_csv_import_flow(client: TestClient, db_session):
     # 1. Register User which creates Party and Accounts (Groceries)
     login_data = {"username": "importuser", "password": "password123"}
@@ -14,19 +22,10 @@ def test_csv_import_flow(client: TestClient, db_session):
     token = resp.json()["access_token"]
     headers = {"Authorization": f"Bearer {token}"}
 
-    # 2. Prepare CSV (Assume Groceries account exists)
-    csv_content = """Date,Description,Amount,Category
-2024-06-01,Whole Foods,150.00,Groceries
-2024-06-02,Uber Trip,-25.50,Transport
-2024-06-03,Unknown store,10.00,
-"""
-    # Note: Uber Trip is negative, our parser takes absolute value. 
-    # Empty category should map to "Uncategorized"
-    
-    file_obj = io.BytesIO(csv_content.encode('utf-8'))
-    
+    # 2. Prepare CSV (Assume Groceries account exists): see _CSV
+
     # 3. POST /imports/csv
-    files = {"file": ("test.csv", file_obj, "text/csv")}
+    files = {"file": ("test.csv", io.BytesIO(_CSV), "text/csv")}
     resp = client.post("/api/imports/csv", files=files, headers=headers)
     
     assert resp.status_code == 200
@@ -1,8 +1,7 @@
 
 from fastapi.testclient import TestClient
-from app.models import LedgerTransaction
 
-def test_explicit_source_flow(client: TestClient, db_session):
+def test_explicit_source_flow(client: TestClient, db_session, fetch_txn, index_entries):
     # 1. Register
     login_data = {"username": "sourceuser", "password": "password123"}
     resp = client.post("/api/auth/register", json=login_data)
@@ -30,13 +29,14 @@ def test_explicit_source_flow(client: TestClient, db_session):
     assert resp.status_code == 201
     
     # 5. Verify Database
-    txn = db_session.query(LedgerTransaction).filter(LedgerTransaction.description == "New Laptop").first()
+    txn = fetch_txn("New Laptop")
     assert txn is not None
     
     # Check entries
     # Should be: Credit Liability (-2000), Debit Expense (+2000)
-    cc_entry = next(e for e in txn.entries if e.account_id == cc_id)
-    exp_entry = next(e for e in txn.entries if e.account_id == cat_id)
+    entries = index_entries(txn)
+    cc_entry = entries[cc_id]
+    exp_entry = entries[cat_id]
     
     assert cc_entry.amount == -2000.0
     assert exp_entry.amount == 2000.0
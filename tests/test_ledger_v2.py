@@ -3,6 +3,8 @@ from datetime import datetime
 from app.services.ledger_service import LedgerService
 from app.models import Entry
 
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
 def test_ledger_double_entry(db_session):
     service = LedgerService(db_session)
     
@@ -16,7 +18,7 @@ def test_ledger_double_entry(db_session):
         {"account_id": cash.id, "amount": -50.0},
         {"account_id": groceries.id, "amount": 50.0}
     ]
-    txn = service.record_transaction(party.id, "Weekly Groceries", datetime.now(), entries)
+    txn = service.record_transaction(party.id, "Weekly Groceries", _NOW, entries)
     
     # 3. Verify
     assert txn.description == "Weekly Groceries"
@@ -35,4 +37,4 @@ def test_ledger_double_entry(db_session):
         {"account_id": groceries.id, "amount": 40.0} # Missing 10
     ]
     with pytest.raises(ValueError, match="Transaction not balanced"):
-        service.record_transaction(party.id, "Bad Txn", datetime.now(), unbalanced_entries)
+        service.record_transaction(party.id, "Bad Txn", _NOW, unbalanced_entries)
@@ -1,8 +1,7 @@
 
 from fastapi.testclient import TestClient
-from app.models import LedgerTransaction
 
-def test_personal_share_flow(client: TestClient, db_session):
+def test_personal_share_flow(client: TestClient, db_session, fetch_txn, index_entries):
     # 1. Register & Login
     login_data = {"username": "shareuser", "password": "password123"}
     client.post("/api/auth/register", json=login_data)
@@ -27,7 +26,7 @@ def test_personal_share_flow(client: TestClient, db_session):
     assert resp.status_code == 201
     
     # 4. Verify Ledger
-    txn = db_session.query(LedgerTransaction).filter(LedgerTransaction.description == "Shared Dinner").first()
+    txn = fetch_txn("Shared Dinner")
     assert txn is not None
     
     # Check entries
@@ -38,7 +37,7 @@ def test_personal_share_flow(client: TestClient, db_session):
     assert len(txn.entries) == 3
     
     source_entry = next(e for e in txn.entries if e.amount == -100.0)
-    personal_entry = next(e for e in txn.entries if e.account_id == cat_id)
+    personal_entry = index_entries(txn)[cat_id]
     reimb_entry = next(e for e in txn.entries if e.account_id != cat_id and e.amount > 0 and e.amount != 40.0)
     
     assert personal_entry.amount == 40.0
@@ -1,7 +1,24 @@
 
 from fastapi.testclient import TestClient
 from datetime import datetime
-from app.models import LedgerTransaction
+import uuid
+from app.models import Account, Entry, LedgerTransaction, User
+
+def seed_txns(db_session, username, txns):
+    """Insert (category_id, amount, description, date) expenses paid from Cash in one batch per table"""
+    party_id = db_session.query(User.party_id).filter(User.username == username).scalar()
+    cash_id = db_session.query(Account.id).filter(Account.owner_id == party_id, Account.name == "Cash").first()[0]
+
+    txn_rows, entry_rows = [], []
+    for category_id, amount, description, date in txns:
+        txn_id = str(uuid.uuid4())
+        txn_rows.append({"id": txn_id, "owner_id": party_id, "description": description, "date": date})
+        entry_rows.append({"id": str(uuid.uuid4()), "transaction_id": txn_id, "account_id": cash_id, "amount": -amount})
+        entry_rows.append({"id": str(uuid.uuid4()), "transaction_id": txn_id, "account_id": category_id, "amount": amount})
+
+    db_session.bulk_insert_mappings(LedgerTransaction, txn_rows)
+    db_session.bulk_insert_mappings(Entry, entry_rows)
+    db_session.commit()
 
 def test_reports_flow(client: TestClient, db_session):
     # 1. Register User (user: "reportuser")
@@ -15,48 +32,20 @@ def test_reports_flow(client: TestClient, db_session):
     cats = client.get("/api/categories", headers=headers).json()
     groceries = next(c for c in cats if c["name"] == "Groceries")
     
-    # 3. Create Transactions for May 2024
-    # Transaction 1: $100 Groceries
-    client.post("/api/transactions", json={
-        "category_id": groceries["id"],
-        "amount": 100.0,
-        "description": "Weekly Shop",
-        "type": "DEBIT",
-        "occurred_on": "2024-05-15T12:00:00"
-    }, headers=headers)
-
-    # Transaction 2: $50 Groceries
-    client.post("/api/transactions", json={
-        "category_id": groceries["id"],
-        "amount": 50.0,
-        "description": "Snacks",
-        "type": "DEBIT",
-        "occurred_on": "2024-05-20T12:00:00"
-    }, headers=headers)
-    
-    # Transaction 3: $20 Utilities (Create Category first?)
-    # For MVP we only have default categories. Assuming Utilities exists or we use Groceries.
-    # Let's create 'Utilities' via API? No, create_category API exists.
+    # 3. Create 'Utilities' category
     cat_resp = client.post("/api/categories", json={"name": "Utilities"}, headers=headers)
     assert cat_resp.status_code == 201
     utils_id = cat_resp.json()["id"]
 
-    client.post("/api/transactions", json={
-        "category_id": utils_id,
-        "amount": 200.0,
-        "description": "Electric Bill",
-        "type": "DEBIT",
-        "occurred_on": "2024-05-25T12:00:00"
-    }, headers=headers)
-
-    # 4. Create Transaction for DIFFERENT Month (June) - Should ensure filter works
-    client.post("/api/transactions", json={
-        "category_id": groceries["id"],
-        "amount": 999.0,
-        "description": "June Shop",
-        "type": "DEBIT",
-        "occurred_on": "2024-06-01T12:00:00"
-    }, headers=headers)
+    # 4. Seed ledger rows directly; the reports are what's under test here
+    # May 2024: $100 + $50 Groceries, $200 Utilities
+    # June 2024: $999 Groceries - Should ensure filter works
+    seed_txns(db_session, "reportuser", [
+        (groceries["id"], 100.0, "Weekly Shop", datetime(2024, 5, 15, 12)),
+        (groceries["id"], 50.0, "Snacks", datetime(2024, 5, 20, 12)),
+        (utils_id, 200.0, "Electric Bill", datetime(2024, 5, 25, 12)),
+        (groceries["id"], 999.0, "June Shop", datetime(2024, 6, 1, 12)),
+    ])
 
     # 5. GET /reports/monthly-category?year=2024&month=5
     resp = client.get("/api/reports/monthly-category?year=2024&month=5", headers=headers)
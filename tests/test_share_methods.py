@@ -1,8 +1,9 @@
 
+import pytest
 from fastapi.testclient import TestClient
-from app.models import LedgerTransaction
 
-def test_share_methods(client: TestClient, db_session):
+@pytest.fixture
+def auth_and_cat(client: TestClient):
     # 1. Register & Login
     login_data = {"username": "sharemethoduser", "password": "password123"}
     client.post("/api/auth/register", json=login_data)
@@ -10,48 +11,57 @@ def test_share_methods(client: TestClient, db_session):
 
     # 2. Create Category
     resp = client.post("/api/categories", json={"name": "Vacation"}, headers=headers)
-    cat_id = resp.json()["id"]
+    return headers, resp.json()["id"]
+
+@pytest.mark.parametrize("description,method,value,total,exp,reimb", [
+    # Percentage (I pay 40% of 200) -> 80 Expense, 120 Reimbursable
+    ("Hotel", "PERCENTAGE", 40.0, 200.00, 80.0, 120.0),
+    # Equal Split (3 people, Total 300) -> 100 Expense, 200 Reimbursable
+    ("Group Dinner", "EQUAL", 3, 300.00, 100.0, 200.0),
+    # Fixed (I pay 50 of 200) -> 50 Expense, 150 Reimbursable
+    ("Concert Tickets", "FIXED", 50.0, 200.00, 50.0, 150.0),
+])
+def test_share_method(client: TestClient, db_session, fetch_txn, index_entries, auth_and_cat, description, method, value, total, exp, reimb):
+    headers, cat_id = auth_and_cat
 
-    # Test A: Percentage (I pay 40% of 200) -> 80 Expense, 120 Reimbursable
     txn_data = {
         "category_id": cat_id,
-        "description": "Hotel",
-        "amount": 200.00,
+        "description": description,
+        "amount": total,
         "type": "DEBIT",
         "occurred_on": "2024-10-01T12:00:00",
         "share": {
-            "method": "PERCENTAGE",
-            "value": 40.0
+            "method": method,
+            "value": value
         }
     }
     resp = client.post("/api/transactions", json=txn_data, headers=headers)
     assert resp.status_code == 201
-    
-    txn = db_session.query(LedgerTransaction).filter(LedgerTransaction.description == "Hotel").first()
-    expense = next(e for e in txn.entries if e.account_id == cat_id)
-    reimb = next(e for e in txn.entries if e.account.name == "Reimbursable")
-    
-    assert expense.amount == 80.0
-    assert reimb.amount == 120.0
-
-    # Test B: Equal Split (3 people, Total 300) -> 100 Expense, 200 Reimbursable
+
+    txn = fetch_txn(description)
+    expense = index_entries(txn)[cat_id]
+    reimbursable = next(e for e in txn.entries if e.account.name == "Reimbursable")
+
+    assert expense.amount == exp
+    assert reimbursable.amount == reimb
+
+@pytest.mark.parametrize("method,value", [
+    ("PERCENTAGE", 150),
+    ("EQUAL", 0),
+    ("EQUAL", 2.5),
+    ("FIXED", 0),
+    ("FIXED", -5),
+])
+def test_share_value_out_of_range(client: TestClient, auth_and_cat, method, value):
+    headers, cat_id = auth_and_cat
+
     txn_data = {
         "category_id": cat_id,
-        "description": "Group Dinner",
-        "amount": 300.00,
+        "description": "Bad Share",
+        "amount": 100.00,
         "type": "DEBIT",
-        "occurred_on": "2024-10-02T12:00:00",
-        "share": {
-            "method": "EQUAL",
-            "value": 3
-        }
+        "occurred_on": "2024-10-01T12:00:00",
+        "share": {"method": method, "value": value}
     }
     resp = client.post("/api/transactions", json=txn_data, headers=headers)
-    assert resp.status_code == 201
-
-    txn = db_session.query(LedgerTransaction).filter(LedgerTransaction.description == "Group Dinner").first()
-    expense = next(e for e in txn.entries if e.account_id == cat_id)
-    reimb = next(e for e in txn.entries if e.account.name == "Reimbursable")
-    
-    assert expense.amount == 100.0
-    assert reimb.amount == 200.0
+    assert resp.status_code == 422
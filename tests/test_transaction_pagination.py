@@ -0,0 +1,44 @@
+import pytest
+from fastapi.testclient import TestClient
+
+@pytest.fixture
+def headers(client: TestClient):
+    login_data = {"username": "pageuser", "password": "password123"}
+    client.post("/api/auth/register", json=login_data)
+    headers = {"Authorization": f"Bearer {client.post('/api/auth/login', json=login_data).json()['access_token']}"}
+
+    cat_id = client.post("/api/categories", json={"name": "Coffee"}, headers=headers).json()["id"]
+    # Two transactions per day so the id tie-break is exercised on the page boundary
+    for i in range(7):
+        txn_data = {
+            "category_id": cat_id,
+            "description": f"Latte {i}",
+            "amount": 4.0 + i,
+            "type": "DEBIT",
+            "occurred_on": f"2024-05-0{1 + i // 2}T08:00:00",
+        }
+        assert client.post("/api/transactions", json=txn_data, headers=headers).status_code == 201
+    return headers
+
+def test_keyset_pages_do_not_overlap(client: TestClient, headers):
+    first = client.get("/api/transactions", params={"limit": 5}, headers=headers)
+    assert first.status_code == 200
+    page1 = first.json()
+    assert len(page1) == 5
+
+    last = page1[-1]
+    params = {"limit": 5, "before_date": last["occurred_on"], "before_id": last["id"]}
+    page2 = client.get("/api/transactions", params=params, headers=headers).json()
+    assert len(page2) == 2
+
+    ids = [t["id"] for t in page1 + page2]
+    assert len(set(ids)) == 7
+    assert {t["description"] for t in page1 + page2} == {f"Latte {i}" for i in range(7)}
+
+@pytest.mark.parametrize("params", [
+    {"before_date": "2024-05-01T08:00:00"},
+    {"before_id": "00000000-0000-0000-0000-000000000000"},
+])
+def test_partial_cursor_is_rejected(client: TestClient, headers, params):
+    resp = client.get("/api/transactions", params=params, headers=headers)
+    assert resp.status_code == 422
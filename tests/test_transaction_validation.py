@@ -0,0 +1,41 @@
+import pytest
+from fastapi.testclient import TestClient
+
+@pytest.mark.parametrize("txn_type", ["debit", "Debit"])
+def test_transaction_type_is_case_insensitive(client: TestClient, db_session, fetch_txn, txn_type):
+    login_data = {"username": "typecaseuser", "password": "password123"}
+    client.post("/api/auth/register", json=login_data)
+    headers = {"Authorization": f"Bearer {client.post('/api/auth/login', json=login_data).json()['access_token']}"}
+
+    cat_id = client.post("/api/categories", json={"name": "Books"}, headers=headers).json()["id"]
+
+    txn_data = {
+        "category_id": cat_id,
+        "description": "Paperback",
+        "amount": 12.50,
+        "type": txn_type,
+        "occurred_on": "2024-03-01T12:00:00",
+    }
+    resp = client.post("/api/transactions", json=txn_data, headers=headers)
+    assert resp.status_code == 201
+
+    txn = fetch_txn("Paperback")
+    assert len(txn.entries) == 2
+
+@pytest.mark.parametrize("description", ["a<script>", "Lunch; DROP TABLE"])
+def test_description_outside_whitelist_is_rejected(client: TestClient, description):
+    login_data = {"username": "descuser", "password": "password123"}
+    client.post("/api/auth/register", json=login_data)
+    headers = {"Authorization": f"Bearer {client.post('/api/auth/login', json=login_data).json()['access_token']}"}
+
+    cat_id = client.post("/api/categories", json={"name": "Misc"}, headers=headers).json()["id"]
+
+    txn_data = {
+        "category_id": cat_id,
+        "description": description,
+        "amount": 5.00,
+        "type": "DEBIT",
+        "occurred_on": "2024-03-01T12:00:00",
+    }
+    resp = client.post("/api/transactions", json=txn_data, headers=headers)
+    assert resp.status_code == 422
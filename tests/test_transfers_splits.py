@@ -1,8 +1,9 @@
 
 from fastapi.testclient import TestClient
+from sqlalchemy.orm import selectinload
 from app.models import LedgerTransaction
 
-def test_transfer_flow(client: TestClient, db_session):
+def test_transfer_flow(client: TestClient, db_session, fetch_txn, index_entries):
     # 1. Register & Login
     login_data = {"username": "transferuser", "password": "password123"}
     resp = client.post("/api/auth/register", json=login_data)
@@ -35,20 +36,21 @@ def test_transfer_flow(client: TestClient, db_session):
     assert resp.status_code == 201
     
     # 4. Verify Ledger
-    txn = db_session.query(LedgerTransaction).filter(LedgerTransaction.description == "Save for rainy day").first()
+    txn = fetch_txn("Save for rainy day")
     assert txn is not None
     
     # Check Entries
     # Credit Checking (-500)
     # Debit Savings (+500)
     
-    checking_entry = next(e for e in txn.entries if e.account_id == checking_id)
-    savings_entry = next(e for e in txn.entries if e.account_id == savings_id)
+    entries = index_entries(txn)
+    checking_entry = entries[checking_id]
+    savings_entry = entries[savings_id]
     
     assert checking_entry.amount == -500.0
     assert savings_entry.amount == 500.0
     
-def test_split_transaction_flow(client: TestClient, db_session):
+def test_split_transaction_flow(client: TestClient, db_session, index_entries):
     # 1. Register & Login (Reuse or new)
     login_data = {"username": "splituser", "password": "password123"}
     client.post("/api/auth/register", json=login_data)
@@ -82,12 +84,15 @@ def test_split_transaction_flow(client: TestClient, db_session):
     assert transactions[1]["amount"] == 40.0
     
     # 4. Verify Ledger - Should have 2 separate LedgerTransactions
-    txn1 = db_session.query(LedgerTransaction).filter(
-        LedgerTransaction.description == "Groceries at Walmart"
-    ).first()
-    txn2 = db_session.query(LedgerTransaction).filter(
-        LedgerTransaction.description == "Home supplies at Walmart"
-    ).first()
+    rows = {
+        t.description: t
+        for t in db_session.query(LedgerTransaction)
+        .options(selectinload(LedgerTransaction.entries))
+        .filter(LedgerTransaction.description.in_(["Groceries at Walmart", "Home supplies at Walmart"]))
+        .all()
+    }
+    txn1 = rows.get("Groceries at Walmart")
+    txn2 = rows.get("Home supplies at Walmart")
     
     assert txn1 is not None
     assert txn2 is not None
@@ -97,8 +102,8 @@ def test_split_transaction_flow(client: TestClient, db_session):
     assert len(txn2.entries) == 2
     
     # Verify amounts
-    cat1_entry = next(e for e in txn1.entries if e.account_id == cat1)
+    cat1_entry = index_entries(txn1)[cat1]
     assert cat1_entry.amount == 60.0
     
-    cat2_entry = next(e for e in txn2.entries if e.account_id == cat2)
+    cat2_entry = index_entries(txn2)[cat2]
     assert cat2_entry.amount == 40.0